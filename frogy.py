@@ -10,17 +10,35 @@ import sys
 import re
 import json
 import csv
+import fnmatch
+import gzip
+import hashlib
 import subprocess
 import argparse
+import functools
 import shutil
 import tempfile
+import zipfile
+import urllib.error
 import urllib.request
 import urllib.parse
+from collections import defaultdict
+from itertools import chain
 from pathlib import Path
-from typing import List, Optional, Set, Dict
+from typing import BinaryIO, Callable, Iterable, Iterator, List, Optional, Set, Dict, Union
+import queue
 import signal
+import ssl
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson
+except ImportError:  # Optional speedup, the stdlib parser is used otherwise
+    orjson = None
+
+json_loads = orjson.loads if orjson else json.loads
 
 FROGY_FORK_VER = '0.0.3'
 
@@ -70,6 +88,10 @@ class Colors:
     FROG_EYE = '\033[38;5;226m'  # Yellow for eyes
 
 
+# SGR sequences emitted by colorize(), stripped when measuring visible width
+_ANSI_RE = re.compile(r'\033\[[0-9;]*m')
+
+
 def colorize(text: str, color: str) -> str:
     """Apply color to text if terminal supports it"""
     if not sys.stdout.isatty():
@@ -77,47 +99,67 @@ def colorize(text: str, color: str) -> str:
     return f"{color}{text}{Colors.RESET}"
 
 
+def colorize_padded(text: str, width: int, color: str) -> str:
+    """Left-align text to width and apply color in a single format"""
+    if not sys.stdout.isatty():
+        return f"{text:<{width}}"
+    return f"{color}{text:<{width}}{Colors.RESET}"
+
+
+# Serializes output from enumeration stages running in worker threads
+_print_lock = threading.Lock()
+
+
+def emit(text: str):
+    """Print text as a single write so concurrent stages don't interleave"""
+    with _print_lock:
+        sys.stdout.write(text + '\n')
+        sys.stdout.flush()
+
+
 def print_header(text: str):
     """Print header message"""
-    print(colorize(f"\n{'='*60}", Colors.BRIGHT_CYAN))
-    print(colorize(f"  {text}", Colors.BOLD + Colors.BRIGHT_CYAN))
-    print(colorize(f"{'='*60}", Colors.BRIGHT_CYAN))
+    emit('\n'.join([
+        colorize(f"\n{'='*60}", Colors.BRIGHT_CYAN),
+        colorize(f"  {text}", Colors.BOLD + Colors.BRIGHT_CYAN),
+        colorize(f"{'='*60}", Colors.BRIGHT_CYAN),
+    ]))
 
 
 def print_success(text: str):
     """Print success message"""
-    print(colorize(f"✓ {text}", Colors.BRIGHT_GREEN))
+    emit(colorize(f"✓ {text}", Colors.BRIGHT_GREEN))
 
 
 def print_info(text: str):
     """Print info message"""
-    print(colorize(f"ℹ {text}", Colors.BRIGHT_BLUE))
+    emit(colorize(f"ℹ {text}", Colors.BRIGHT_BLUE))
 
 
 def print_warning(text: str):
     """Print warning message"""
-    print(colorize(f"⚠ {text}", Colors.BRIGHT_YELLOW))
+    emit(colorize(f"⚠ {text}", Colors.BRIGHT_YELLOW))
 
 
 def print_error(text: str):
     """Print error message"""
-    print(colorize(f"✗ {text}", Colors.BRIGHT_RED))
+    emit(colorize(f"✗ {text}", Colors.BRIGHT_RED))
 
 
 def print_step(text: str):
     """Print step message"""
-    print(colorize(f"→ {text}", Colors.BRIGHT_MAGENTA))
+    emit(colorize(f"→ {text}", Colors.BRIGHT_MAGENTA))
 
 
 def print_count(tool: str, count: int):
     """Print count result"""
     color = Colors.BRIGHT_GREEN if count > 0 else Colors.DIM
-    print(colorize(f"  {tool} count: {count}", color))
+    emit(colorize(f"  {tool} count: {count}", color))
 
 
 def print_detail(text: str):
     """Print detail message in gray"""
-    print(colorize(f"  {text}", Colors.DIM))
+    emit(colorize(f"  {text}", Colors.DIM))
 
 
 BANNER = f"""
@@ -151,6 +193,58 @@ def timeout_handler(signum, frame):
     raise TimeoutError("Command execution timed out")
 
 
+class UIManager:
+    """Single background thread that renders spinner and progress bar updates"""
+    def __init__(self):
+        self.events = queue.Queue()
+        self.thread = None
+        self.thread_lock = threading.Lock()
+        self.spinner = None
+
+    def send(self, event: str, payload=None, wait: bool = False):
+        """Queue an event for the UI thread, optionally waiting until it is handled"""
+        with self.thread_lock:
+            if self.thread is None:
+                self.thread = threading.Thread(target=self._run, daemon=True)
+                self.thread.start()
+        done = threading.Event() if wait else None
+        self.events.put((event, payload, done))
+        if done:
+            done.wait(timeout=1)
+
+    def _run(self):
+        """Internal event loop, only ticks while a spinner is active"""
+        while True:
+            try:
+                event, payload, done = self.events.get(
+                    timeout=0.1 if self.spinner else None)
+            except queue.Empty:
+                event, payload, done = 'tick', None, None
+
+            with _print_lock:
+                if event == 'start':
+                    self.spinner = payload
+                    # Print details once before starting spinner
+                    for detail in payload.details:
+                        sys.stdout.write(colorize(f"  {detail}", Colors.DIM) + '\n')
+                elif event == 'stop':
+                    self.spinner = None
+                    # Clear the spinner line
+                    sys.stdout.write('\r' + ' ' * (len(payload.message) + 20) + '\r')
+                elif event == 'render':
+                    sys.stdout.write(payload)
+
+                if self.spinner:
+                    sys.stdout.write(self.spinner.frame())
+                sys.stdout.flush()
+
+            if done:
+                done.set()
+
+
+UI = UIManager()
+
+
 class Spinner:
     """Simple spinner for progress indication"""
     def __init__(self, message="Processing", color=Colors.BRIGHT_CYAN, details=None):
@@ -159,43 +253,24 @@ class Spinner:
         self.details = details or []
         self.spinner_chars = ['⠋', '⠙', '⠹', '⠸', '⠼', '⠴', '⠦', '⠧', '⠇', '⠏']
         self.spinner_index = 0
-        self.stop_spinner = False
-        self.spinner_thread = None
-        self.details_printed = False
-
-    def _spin(self):
-        """Internal spinner loop"""
-        # Print details once before starting spinner
-        if self.details and not self.details_printed:
-            for detail in self.details:
-                print(colorize(f"  {detail}", Colors.DIM))
-            self.details_printed = True
-
-        while not self.stop_spinner:
-            char = self.spinner_chars[self.spinner_index % len(self.spinner_chars)]
-            sys.stdout.write(f'\r{self.color}{char} {self.message}...{Colors.RESET}')
-            sys.stdout.flush()
-            self.spinner_index += 1
-            time.sleep(0.1)
+
+    def frame(self) -> str:
+        """Return the next animation frame"""
+        char = self.spinner_chars[self.spinner_index % len(self.spinner_chars)]
+        self.spinner_index += 1
+        return f'\r{self.color}{char} {self.message}...{Colors.RESET}'
 
     def start(self):
         """Start the spinner"""
-        self.stop_spinner = False
-        self.spinner_thread = threading.Thread(target=self._spin, daemon=True)
-        self.spinner_thread.start()
+        UI.send('start', self)
 
     def stop(self, success=True):
         """Stop the spinner"""
-        self.stop_spinner = True
-        if self.spinner_thread:
-            self.spinner_thread.join(timeout=0.5)
-        # Clear the spinner line
-        sys.stdout.write('\r' + ' ' * (len(self.message) + 20) + '\r')
-        sys.stdout.flush()
+        UI.send('stop', self, wait=True)
         if success:
-            print(f'{Colors.BRIGHT_GREEN}✓{Colors.RESET} {self.message} completed')
+            emit(f'{Colors.BRIGHT_GREEN}✓{Colors.RESET} {self.message} completed')
         else:
-            print(f'{Colors.BRIGHT_YELLOW}⚠{Colors.RESET} {self.message} finished with warnings')
+            emit(f'{Colors.BRIGHT_YELLOW}⚠{Colors.RESET} {self.message} finished with warnings')
 
 
 class ProgressBar:
@@ -213,21 +288,73 @@ class ProgressBar:
         percent = (self.current / self.total) * 100 if self.total > 0 else 0
         filled = int(self.bar_length * self.current / self.total) if self.total > 0 else 0
         bar = '█' * filled + '░' * (self.bar_length - filled)
-        sys.stdout.write(f'\r{self.color}{self.message}: [{bar}] {percent:.1f}% ({self.current}/{self.total}){Colors.RESET}')
-        sys.stdout.flush()
+        UI.send('render', f'\r{self.color}{self.message}: [{bar}] {percent:.1f}% ({self.current}/{self.total}){Colors.RESET}')
 
     def finish(self):
         """Finish progress bar"""
         self.update(self.total)
-        print()  # New line after progress bar
+        UI.send('render', '\n', wait=True)  # New line after progress bar
+
+
+class Interrupted(Exception):
+    """Raised in enumeration stages once the run has been interrupted"""
+    pass
+
+
+# Commands started by run_command/stream_command that have not exited yet, so an
+# interrupt can take down their process groups (they don't see the terminal's SIGINT)
+_running_processes: Set[subprocess.Popen] = set()
+_running_lock = threading.Lock()
+
+# Set on interrupt; stages still running in worker threads stop at their next step
+_stop_event = threading.Event()
+
+
+def check_stopped():
+    """Raise Interrupted if the run has been interrupted"""
+    if _stop_event.is_set():
+        raise Interrupted("Run interrupted")
+
+
+def start_process(cmd: List[str], **kwargs) -> subprocess.Popen:
+    """Start a command in its own process group and register it as running"""
+    # Checked under the lock so nothing can start after kill_running_processes()
+    with _running_lock:
+        check_stopped()
+        process = subprocess.Popen(
+            cmd,
+            preexec_fn=os.setsid if os.name != 'nt' else None,
+            **kwargs
+        )
+        _running_processes.add(process)
+    return process
+
+
+def forget_process(process: subprocess.Popen):
+    """Unregister a command once it has been waited for"""
+    with _running_lock:
+        _running_processes.discard(process)
+
+
+def kill_running_processes():
+    """Refuse to start new commands and terminate every command still running"""
+    with _running_lock:
+        _stop_event.set()
+        processes = list(_running_processes)
+        _running_processes.clear()
+    for process in processes:
+        kill_process(process)
 
 
 def run_command(cmd: List[str], timeout: int = 300, silent: bool = True,
                 cwd: Optional[str] = None, show_spinner: bool = False,
-                spinner_message: str = "Processing", spinner_details: Optional[List[str]] = None) -> tuple[int, str, str]:
+                spinner_message: str = "Processing", spinner_details: Optional[List[str]] = None,
+                text: bool = True) -> tuple[int, Union[str, bytes], Union[str, bytes]]:
     """
     Run a command with timeout and return exit code, stdout, stderr
+    (str, or bytes when text is False)
     """
+    empty = '' if text else b''
     spinner = None
     if show_spinner and sys.stdout.isatty():
         spinner = Spinner(spinner_message, Colors.BRIGHT_CYAN, spinner_details)
@@ -237,13 +364,12 @@ def run_command(cmd: List[str], timeout: int = 300, silent: bool = True,
         stdout_pipe = subprocess.PIPE if silent else None
         stderr_pipe = subprocess.PIPE if silent else subprocess.STDOUT
 
-        process = subprocess.Popen(
+        process = start_process(
             cmd,
             stdout=stdout_pipe,
             stderr=stderr_pipe,
             cwd=cwd,
-            text=True,
-            preexec_fn=os.setsid if os.name != 'nt' else None
+            text=text
         )
 
         try:
@@ -251,23 +377,141 @@ def run_command(cmd: List[str], timeout: int = 300, silent: bool = True,
             exit_code = process.returncode
             if spinner:
                 spinner.stop(success=(exit_code == 0))
-            return exit_code, stdout or '', stderr or ''
+            return exit_code, stdout or empty, stderr or empty
         except subprocess.TimeoutExpired:
-            # Kill the process group to ensure all child processes are terminated
-            if os.name != 'nt':
-                os.killpg(os.getpgid(process.pid), signal.SIGTERM)
-            else:
-                process.kill()
+            kill_process(process)
             process.wait()
             if spinner:
                 spinner.stop(success=False)
-            return -1, '', f'Command timed out after {timeout} seconds'
+            error = f'Command timed out after {timeout} seconds'
+            return -1, empty, error if text else error.encode()
+        finally:
+            forget_process(process)
+    except Exception as e:
+        if spinner:
+            spinner.stop(success=False)
+        return -1, empty, str(e) if text else str(e).encode()
+
+
+def run_command_bytes(cmd: List[str], timeout: int = 300,
+                      cwd: Optional[str] = None) -> tuple[int, bytes, bytes]:
+    """
+    Run a command like run_command, but return stdout and stderr undecoded
+    """
+    return run_command(cmd, timeout=timeout, cwd=cwd, text=False)
+
+
+def decode_lines(data: bytes) -> List[str]:
+    """Split raw tool output into stripped, non-empty lines"""
+    try:
+        text = data.decode('utf-8')
+    except UnicodeDecodeError:
+        # Drop only the undecodable lines; stripping bytes would turn them into other hostnames
+        lines = []
+        for line in map(bytes.strip, data.split(b'\n')):
+            if line:
+                try:
+                    lines.append(line.decode('utf-8'))
+                except UnicodeDecodeError:
+                    continue
+        return lines
+    return [line for line in map(str.strip, text.split('\n')) if line]
+
+
+def kill_process(process: subprocess.Popen):
+    """Terminate a command started by run_command or stream_command"""
+    try:
+        # Kill the process group to ensure all child processes are terminated
+        if os.name != 'nt':
+            os.killpg(os.getpgid(process.pid), signal.SIGTERM)
+        else:
+            process.kill()
+    except ProcessLookupError:
+        pass
+
+
+def stream_command(cmd: List[str], consumer: Callable[[Iterable], None], timeout: int = 300,
+                   tee_file: Optional[Path] = None, text: bool = True, show_spinner: bool = False,
+                   spinner_message: str = "Processing", spinner_details: Optional[List[str]] = None) -> tuple[int, str]:
+    """
+    Run a command with timeout, passing its stdout lines to consumer as they are
+    produced and copying them to tee_file. Returns exit code and error message
+    """
+    spinner = None
+    if show_spinner and sys.stdout.isatty():
+        spinner = Spinner(spinner_message, Colors.BRIGHT_CYAN, spinner_details)
+        spinner.start()
+
+    # Tool output can carry arbitrary bytes (page titles, TXT records); one bad byte
+    # must not abort the consumer and lose the rest of the stream
+    encoding = {'encoding': 'utf-8', 'errors': 'replace'} if text else {}
+    try:
+        process = start_process(
+            cmd,
+            stdout=subprocess.PIPE,
+            # Nothing reads stderr while stdout is streamed, so don't let it fill a pipe
+            stderr=subprocess.DEVNULL,
+            **encoding
+        )
     except Exception as e:
         if spinner:
             spinner.stop(success=False)
-        return -1, '', str(e)
+        return -1, str(e)
+
+    timed_out = threading.Event()
+
+    def on_timeout():
+        timed_out.set()
+        kill_process(process)
+
+    timer = threading.Timer(timeout, on_timeout)
+    timer.daemon = True
+    timer.start()
 
+    out = None
 
+    def lines():
+        for line in process.stdout:
+            if out:
+                out.write(line)
+            yield line
+
+    error = ''
+    try:
+        if tee_file:
+            out = open(tee_file, 'w' if text else 'wb', **encoding)
+        stream = lines()
+        consumer(stream)
+        # Drain whatever the consumer left so the copy in tee_file is complete
+        for _ in stream:
+            pass
+    except Exception as e:
+        kill_process(process)
+        error = str(e)
+    except BaseException:
+        # The tool is in its own session and never saw the SIGINT, so don't wait on it
+        kill_process(process)
+        if spinner:
+            spinner.stop(success=False)
+        raise
+    finally:
+        timer.cancel()
+        if out:
+            out.close()
+        process.stdout.close()
+        exit_code = process.wait()
+        forget_process(process)
+
+    if timed_out.is_set():
+        exit_code, error = -1, f'Command timed out after {timeout} seconds'
+    elif error:
+        exit_code = -1
+    if spinner:
+        spinner.stop(success=(exit_code == 0))
+    return exit_code, error
+
+
+@functools.lru_cache(maxsize=None)
 def check_tool(tool_name: str) -> bool:
     """Check if a tool is available in PATH"""
     return shutil.which(tool_name) is not None
@@ -287,50 +531,122 @@ def read_file_lines(filepath: str) -> List[str]:
         return []
 
 
+def count_file_lines(filepath: str) -> int:
+    """Count non-empty lines without decoding them or building a list"""
+    try:
+        with open(filepath, 'rb') as f:
+            return sum(1 for line in f if line.strip())
+    except FileNotFoundError:
+        return 0
+
+
+def unique_byte_lines(lines: Iterable[bytes]) -> List[str]:
+    """Decode, lowercase and deduplicate raw lines in a single pass"""
+    seen = set()
+    result = []
+    for line in lines:
+        try:
+            line = line.decode('utf-8').strip().lower()
+        except UnicodeDecodeError:
+            continue  # Deleting the bad bytes would yield a different hostname
+        if line and line not in seen:
+            seen.add(line)
+            result.append(line)
+    return result
+
+
+def read_file_lines_unique(filepath: str) -> List[str]:
+    """Read file and return its unique non-empty lines, lowercased"""
+    try:
+        with open(filepath, 'rb') as f:
+            return unique_byte_lines(f)
+    except FileNotFoundError:
+        return []
+
+
+def iter_json_lines(filepath: str) -> Iterator[dict]:
+    """Yield each valid JSON object from an NDJSON file"""
+    try:
+        data = Path(filepath).read_bytes()
+    except FileNotFoundError:
+        return
+    # One split in C over the whole buffer instead of per-line file iteration
+    for line in data.split(b'\n'):
+        if line.strip():
+            try:
+                obj = json_loads(line)
+            except json.JSONDecodeError:
+                continue
+            if isinstance(obj, dict):
+                yield obj
+
+
+def _load_and_normalize(filepath: str) -> Set[str]:
+    """Read a domain list and return its lowercased names without trailing dots"""
+    normalized = {domain.lower().rstrip('.') for domain in read_file_lines(filepath)}
+    normalized.discard('')
+    return normalized
+
+
 def write_file_lines(filepath: str, lines: List[str], append: bool = False):
     """Write lines to file"""
     mode = 'a' if append else 'w'
     with open(filepath, mode, encoding='utf-8') as f:
-        for line in lines:
-            f.write(line + '\n')
+        if lines:
+            f.write('\n'.join(lines) + '\n')
 
 
 def unique_lines(lines: List[str]) -> List[str]:
     """Remove duplicates while preserving order"""
     seen = set()
+    seen_add = seen.add
     result = []
+    append = result.append
     for line in lines:
-        line_lower = line.lower().strip()
-        if line_lower and line_lower not in seen:
-            seen.add(line_lower)
-            result.append(line)
+        key = line.lower().strip()
+        if key and key not in seen:
+            seen_add(key)
+            append(line)
     return result
 
 
+# Matched against lowercased text, so only lowercase letters are needed
+_DOMAIN_RE = re.compile(r'(?:[a-z0-9](?:[a-z0-9-]{0,61}[a-z0-9])?\.)+[a-z]{2,}', re.ASCII)
+
+
 def extract_domains_from_text(text: str, domain_filter: Optional[str] = None) -> List[str]:
     """Extract domain names from text"""
-    # Simple domain regex pattern
-    domain_pattern = r'(?:[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?\.)+[a-zA-Z]{2,}'
-    domains = re.findall(domain_pattern, text)
+    # The character classes cannot match '*', '@' or spaces, so matches need
+    # no further validation
+    domains = _DOMAIN_RE.findall(text.lower())
 
     if domain_filter:
-        domains = [d for d in domains if domain_filter.lower() in d.lower()]
+        domain_filter = domain_filter.lower()
+        domains = [d for d in domains if domain_filter in d]
 
-    # Filter out invalid domains
-    filtered = []
-    for domain in domains:
-        domain = domain.lower().strip()
-        if domain and not domain.startswith('*') and '@' not in domain:
-            if ' ' not in domain and '.' in domain:
-                filtered.append(domain)
+    return list(dict.fromkeys(domains))
 
-    return unique_lines(filtered)
 
+# Host part of an absolute URL: skips userinfo, unwraps bracketed IPv6, stops at port/path
+_URL_HOST_RE = re.compile(r'[a-zA-Z][a-zA-Z0-9+.\-]*://(?:[^/?#@]*@)?(?:\[([^\]/?#]*)\]|([^/:?#]+))')
 
-def run_unfurl_domains(input_lines: List[str]) -> List[str]:
-    """Extract domains using unfurl tool"""
-    if not check_tool('unfurl'):
-        return input_lines
+
+def extract_hostname(line: str) -> str:
+    """Extract the hostname from a URL or a bare host[:port][/path] line"""
+    line = line.strip()
+    if '://' in line:
+        try:
+            return urllib.parse.urlsplit(line).hostname or ''
+        except ValueError:
+            return ''
+    return line.split('/', 1)[0].split(':', 1)[0]
+
+
+def run_unfurl_domains(input_lines: List[str], use_tool: bool = False) -> List[str]:
+    """Extract domains from URLs, optionally using the unfurl tool"""
+    if not use_tool or not check_tool('unfurl'):
+        hosts = map(extract_hostname, input_lines)
+        return [host for host in hosts if host]
 
     try:
         process = subprocess.Popen(
@@ -346,40 +662,157 @@ def run_unfurl_domains(input_lines: List[str]) -> List[str]:
         return input_lines
 
 
-def run_anew(new_lines: List[str], existing_lines: List[str]) -> List[str]:
-    """Use anew to filter out existing lines"""
-    if not check_tool('anew'):
-        # Fallback: simple deduplication
-        existing_set = {line.lower().strip() for line in existing_lines}
-        return [line for line in new_lines if line.lower().strip() not in existing_set]
+# Downloads are kept in memory up to this size before spilling to a temp file
+SPOOL_MAX_SIZE = 64 * 1024 * 1024
+
+# Large copy buffer for downloads, CHAOS archives can be hundreds of megabytes
+COPY_BUFSIZE = 4 * 1024 * 1024
+
+# Built once: loading the CA bundle for every request is not free
+SSL_CONTEXT = ssl.create_default_context()
+
+# crt.sh and CHAOS responses are reused from here for CACHE_MAX_AGE seconds
+CACHE_DIR = Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache') / 'frogy'
+CACHE_MAX_AGE = 24 * 60 * 60
+
+
+def http_get(url: str, timeout: int = 30, headers: Optional[Dict[str, str]] = None):
+    """GET url with the shared SSL context; urllib handles redirects, proxies and HTTP errors"""
+    check_stopped()
+    request = urllib.request.Request(url, headers=headers or {})
+    return urllib.request.urlopen(request, timeout=timeout, context=SSL_CONTEXT)
 
+
+def copy_stream(source: BinaryIO, target: BinaryIO):
+    """Copy source into target in COPY_BUFSIZE chunks, stopping if the run is interrupted"""
+    read, write = source.read, target.write
+    while True:
+        check_stopped()
+        chunk = read(COPY_BUFSIZE)
+        if not chunk:
+            break
+        write(chunk)
+
+
+def download(url: str, fileobj: BinaryIO, timeout: int = 30, compress: bool = False):
+    """Download url into fileobj, gzip-compressing the body if requested"""
+    response = http_get(url, timeout, {'Accept-Encoding': 'gzip'})
     try:
-        process = subprocess.Popen(
-            ['anew'],
-            stdin=subprocess.PIPE,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True
-        )
-        # Write existing lines first, then new lines
-        input_data = '\n'.join(existing_lines + new_lines)
-        stdout, _ = process.communicate(input=input_data, timeout=30)
-        return [line.strip() for line in stdout.split('\n') if line.strip()]
-    except Exception:
-        return unique_lines(existing_lines + new_lines)
+        gzipped = response.headers.get('Content-Encoding') == 'gzip'
+        if compress and gzipped:
+            # Already in the format we would store it in
+            copy_stream(response, fileobj)
+        elif compress:
+            with gzip.GzipFile(fileobj=fileobj, mode='wb') as out:
+                copy_stream(response, out)
+        elif gzipped:
+            copy_stream(gzip.GzipFile(fileobj=response), fileobj)
+        else:
+            copy_stream(response, fileobj)
+    finally:
+        response.close()
+
+
+def cache_path(url: str, compress: bool = True) -> Path:
+    """Return the cache file used for url"""
+    return CACHE_DIR / (hashlib.sha256(url.encode()).hexdigest() + ('.gz' if compress else ''))
+
+
+def prune_cache():
+    """Delete cache entries older than CACHE_MAX_AGE, they are never reused"""
+    cutoff = time.time() - CACHE_MAX_AGE
+    try:
+        with os.scandir(CACHE_DIR) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_file() and entry.stat().st_mtime < cutoff:
+                        os.unlink(entry.path)
+                except OSError:
+                    continue
+    except OSError:
+        pass
+
+
+def open_url(url: str, timeout: int = 30, cache: bool = True, compress: bool = True) -> BinaryIO:
+    """
+    Open url as a seekable binary file. With cache, the response is stored in
+    CACHE_DIR (gzip-compressed if compress) and reused while it is fresh
+    """
+    if cache:
+        try:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        except OSError:
+            cache = False
+
+    if not cache:
+        spool = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE)
+        try:
+            download(url, spool, timeout)
+        except BaseException:
+            spool.close()
+            raise
+        spool.seek(0)
+        return spool
+
+    cache_file = cache_path(url, compress)
+    try:
+        fresh = time.time() - cache_file.stat().st_mtime < CACHE_MAX_AGE
+    except FileNotFoundError:
+        fresh = False
+
+    if not fresh:
+        # CHAOS archives are hundreds of megabytes, so drop stale entries before adding one
+        prune_cache()
+        # Download next to the cache entry and rename, so readers never see a partial file
+        with tempfile.NamedTemporaryFile(dir=CACHE_DIR, delete=False) as tmp:
+            try:
+                download(url, tmp, timeout, compress)
+            except BaseException:
+                tmp.close()
+                os.unlink(tmp.name)
+                raise
+        os.replace(tmp.name, cache_file)
+
+    return gzip.open(cache_file, 'rb') if compress else open(cache_file, 'rb')
+
+
+def fetch_json(url: str, timeout: int = 30, cache: bool = True):
+    """Fetch and parse a JSON document, asking the server to gzip the response"""
+    with open_url(url, timeout, cache) as f:
+        data = f.read()
+    try:
+        return json_loads(data)
+    except ValueError:
+        # Don't keep serving an error page or truncated response from the cache
+        if cache:
+            cache_path(url).unlink(missing_ok=True)
+        raise
+
+
+CHAOS_INDEX_URL = 'https://chaos-data.projectdiscovery.io/index.json'
+
+# Last label plus a two/three letter suffix, allowing for suffixes like .co.uk
+_ROOT_DOMAIN_RE = re.compile(r"[^.]+\.[^.]{2,3}(?:\.[^.]{2,3})?$")
 
 
 class Frogy:
-    def __init__(self, domain: str, org: Optional[str] = None, chaos: bool = False):
+    def __init__(self, domain: str, org: Optional[str] = None, chaos: bool = False,
+                 unfurl: bool = False, cache: bool = True):
         self.domain = domain
         self.org = org or domain
         self.chaos = chaos
+        self.unfurl = unfurl
+        self.cache = cache
         self.cdir = normalize_domain(self.org)
         self.cwhois = self.org.replace(' ', '+')
 
         self.output_dir = Path('output') / self.cdir
         self.raw_output_dir = self.output_dir / 'raw_output'
         self.all_domains: List[str] = []
+        # Normalized form of every entry in all_domains, for O(1) membership
+        self._seen_norm: Set[str] = set()
+        # Contents of the .master file, kept once written so later steps don't re-read it
+        self._master_domains: Optional[List[str]] = None
 
         self.setup_directories()
 
@@ -392,23 +825,15 @@ class Frogy:
         self.raw_output_dir.mkdir(parents=True, exist_ok=True)
         (self.raw_output_dir / 'raw_http_responses').mkdir(parents=True, exist_ok=True)
 
-    def chaos_enumeration(self):
+    def chaos_enumeration(self) -> List[str]:
         """CHAOS dataset enumeration"""
-        print_step("Identifying Subdomains")
-
         if not self.chaos:
-            return
+            return []
 
         try:
             # Download CHAOS index
             print_info("Fetching CHAOS dataset index...")
-            urllib.request.urlretrieve(
-                'https://chaos-data.projectdiscovery.io/index.json',
-                'index.json'
-            )
-
-            with open('index.json', 'r') as f:
-                chaos_data = json.load(f)
+            chaos_data = fetch_json(CHAOS_INDEX_URL, cache=self.cache)
 
             # Find matching organization
             chaos_url = None
@@ -419,51 +844,54 @@ class Frogy:
 
             if not chaos_url:
                 print_warning("Could not find data in CHAOS DB...")
-                self.subfinder_enumeration()
-                return
+                return self.subfinder_enumeration()
 
-            # Download and extract CHAOS data
+            # Download CHAOS data and read the archive in place, without
+            # extracting its members into the working directory
             print_info(f"Downloading CHAOS data from {chaos_url}...")
-            zip_file = 'chaos_data.zip'
-            urllib.request.urlretrieve(chaos_url, zip_file)
-
-            shutil.unpack_archive(zip_file, '.', 'zip')
+            def member_lines(zf: zipfile.ZipFile):
+                for name in zf.namelist():
+                    check_stopped()
+                    if name.endswith('.txt'):
+                        with zf.open(name) as member:
+                            yield from member
 
-            # Collect all txt files
-            chaos_domains = []
-            for txt_file in Path('.').glob('*.txt'):
-                chaos_domains.extend(read_file_lines(str(txt_file)))
+            try:
+                with open_url(chaos_url, timeout=300, cache=self.cache, compress=False) as archive:
+                    with zipfile.ZipFile(archive) as zf:
+                        chaos_domains = unique_byte_lines(member_lines(zf))
+            except zipfile.BadZipFile:
+                # As in fetch_json, don't keep serving a non-zip body from the cache
+                if self.cache:
+                    cache_path(chaos_url, compress=False).unlink(missing_ok=True)
+                raise
 
             chaos_file = self.output_dir / 'chaos.txtls'
             write_file_lines(str(chaos_file), chaos_domains)
 
-            domains = run_unfurl_domains(chaos_domains)
-            self.all_domains.extend(domains)
-
-            unique_count = len(unique_lines(chaos_domains))
-            print_count("Chaos", unique_count)
+            domains = run_unfurl_domains(chaos_domains, self.unfurl)
 
-            # Cleanup
-            Path('index.json').unlink(missing_ok=True)
-            Path(zip_file).unlink(missing_ok=True)
-            for txt_file in Path('.').glob('*.txt'):
-                txt_file.unlink(missing_ok=True)
+            print_count("Chaos", len(chaos_domains))
 
             # Run subfinder on chaos domains
             subfinder_domains_file = Path('subfinder.domains')
-            write_file_lines(str(subfinder_domains_file), unique_lines(chaos_domains))
-            self.subfinder_enumeration(str(subfinder_domains_file))
+            write_file_lines(str(subfinder_domains_file), chaos_domains)
+            domains.extend(self.subfinder_enumeration(str(subfinder_domains_file)))
             subfinder_domains_file.unlink(missing_ok=True)
 
+            return domains
+
+        except Interrupted:
+            return []
         except Exception as e:
             print_error(f"CHAOS enumeration error: {e}")
-            self.subfinder_enumeration()
+            return self.subfinder_enumeration()
 
-    def amass_enumeration(self):
+    def amass_enumeration(self) -> List[str]:
         """Amass passive enumeration"""
         if not check_tool('amass'):
             print_warning("Amass not found, skipping...")
-            return
+            return []
 
         print_step("Running Amass enumeration...")
         amass_file = self.output_dir / 'amass.txtls'
@@ -474,50 +902,54 @@ class Frogy:
         )
 
         if amass_file.exists():
-            domains = read_file_lines(str(amass_file))
-            domains = run_unfurl_domains(domains)
-            domains = run_anew(domains, self.all_domains)
-            self.all_domains.extend(domains)
+            domains = read_file_lines_unique(str(amass_file))
+            domains = run_unfurl_domains(domains, self.unfurl)
 
-            unique_count = len(unique_lines(domains))
-            print_count("Amass", unique_count)
-        else:
-            print_count("Amass", 0)
+            print_count("Amass", len(domains))
+            return domains
 
-    def wayback_enumeration(self):
+        print_count("Amass", 0)
+        return []
+
+    def wayback_enumeration(self) -> List[str]:
         """Wayback Machine enumeration"""
         print_step("Running Wayback Machine enumeration...")
         wayback_file = self.output_dir / 'wayback.txtls'
 
         try:
-            url = f"http://web.archive.org/cdx/search/cdx?url=*.{self.domain}&output=txt&fl=original&collapse=urlkey&page="
-            with urllib.request.urlopen(url, timeout=30) as response:
+            url = f"https://web.archive.org/cdx/search/cdx?url=*.{self.domain}&output=txt&fl=original&collapse=urlkey&page="
+            with open_url(url, timeout=30, cache=False) as response:
                 data = response.read().decode('utf-8')
 
             domains = []
+            append = domains.append
             for line in data.split('\n'):
-                if not line.strip():
+                # Extract domain from scheme://host[:port]/... without splitting the whole URL
+                start = line.find('://')
+                if start < 0:
                     continue
-                # Extract domain from URL
-                parts = line.split('/')
-                if len(parts) >= 3:
-                    domain = parts[2].split(':')[0]  # Remove port
-                    if domain and '.' in domain:
-                        domains.append(domain)
+                start += 3
+                end = line.find('/', start)
+                domain = line[start:end] if end >= 0 else line[start:].rstrip()
+                port = domain.find(':')
+                if port >= 0:
+                    domain = domain[:port]
+                if domain and '.' in domain:
+                    append(domain)
 
             domains = unique_lines(domains)
             write_file_lines(str(wayback_file), domains)
 
-            domains = run_unfurl_domains(domains)
-            domains = run_anew(domains, self.all_domains)
-            self.all_domains.extend(domains)
+            domains = run_unfurl_domains(domains, self.unfurl)
 
             print_count("WaybackEngine", len(domains))
+            return domains
         except Exception as e:
             print_error(f"Wayback enumeration error: {e}")
             wayback_file.touch()
+            return []
 
-    def certificate_enumeration(self):
+    def certificate_enumeration(self) -> List[str]:
         """Certificate Transparency enumeration"""
         print_step("Running Certificate Transparency enumeration...")
         whois_file = self.output_dir / 'whois.txtls'
@@ -548,28 +980,24 @@ class Frogy:
                 # Query by organization
                 try:
                     url = f"https://crt.sh/?O={registrant_encoded}&output=json"
-                    with urllib.request.urlopen(url, timeout=30) as response:
-                        data = json.loads(response.read())
-                        for entry in data:
-                            if 'common_name' in entry:
-                                cn = entry['common_name'].replace('*.', '')
-                                if cn and '.' in cn:
-                                    domains.append(cn)
+                    for entry in fetch_json(url, timeout=30, cache=self.cache):
+                        if 'common_name' in entry:
+                            cn = entry['common_name'].replace('*.', '')
+                            if cn and '.' in cn:
+                                domains.append(cn)
                 except Exception:
                     pass
 
             # Query by domain
             try:
                 url = f"https://crt.sh/?q={urllib.parse.quote(self.domain)}&output=json"
-                with urllib.request.urlopen(url, timeout=30) as response:
-                    data = json.loads(response.read())
-                    for entry in data:
-                        if 'name_value' in entry:
-                            names = entry['name_value'].split('\n')
-                            for name in names:
-                                name = name.replace('*.', '').strip()
-                                if name and '.' in name:
-                                    domains.append(name)
+                for entry in fetch_json(url, timeout=30, cache=self.cache):
+                    if 'name_value' in entry:
+                        names = entry['name_value'].split('\n')
+                        for name in names:
+                            name = name.replace('*.', '').strip()
+                            if name and '.' in name:
+                                domains.append(name)
             except Exception as e:
                 print_error(f"Certificate query error: {e}")
 
@@ -578,49 +1006,49 @@ class Frogy:
             domains = [d for d in domains if ' ' not in d and '@' not in d and '.' in d]
             write_file_lines(str(whois_file), domains)
 
-            domains = run_unfurl_domains(domains)
-            domains = run_anew(domains, self.all_domains)
-            self.all_domains.extend(domains)
+            domains = run_unfurl_domains(domains, self.unfurl)
 
             print_count("Certificate search", len(domains))
+            return domains
         except Exception as e:
             print_error(f"Certificate enumeration error: {e}")
             whois_file.touch()
+            return []
 
-    def findomain_enumeration(self):
+    def findomain_enumeration(self) -> List[str]:
         """Findomain enumeration"""
         if not check_tool('findomain'):
             print_warning("Findomain not found, skipping...")
-            return
+            return []
 
         print_step("Running Findomain enumeration...")
         findomain_file = self.output_dir / 'findomain.txtls'
 
-        exit_code, stdout, stderr = run_command(
+        exit_code, stdout, stderr = run_command_bytes(
             ['findomain', '-t', self.domain, '-q'],
             timeout=300
         )
 
-        if stdout:
-            domains = [line.strip() for line in stdout.split('\n') if line.strip()]
+        domains = decode_lines(stdout)
+        if domains:
             write_file_lines(str(findomain_file), domains)
 
-            domains = run_unfurl_domains(domains)
-            domains = run_anew(domains, self.all_domains)
-            self.all_domains.extend(domains)
+            domains = run_unfurl_domains(domains, self.unfurl)
 
             # Filter valid domains
-            domains = [d for d in domains if ' ' not in d and '@' not in d and '.' in d]
-            print_count("Findomain", len(domains))
-        else:
-            findomain_file.touch()
-            print_count("Findomain", 0)
+            valid_domains = [d for d in domains if ' ' not in d and '@' not in d and '.' in d]
+            print_count("Findomain", len(valid_domains))
+            return domains
+
+        findomain_file.touch()
+        print_count("Findomain", 0)
+        return []
 
-    def subfinder_enumeration(self, domain_list_file: Optional[str] = None):
+    def subfinder_enumeration(self, domain_list_file: Optional[str] = None) -> List[str]:
         """Subfinder enumeration"""
         if not check_tool('subfinder'):
             print_warning("Subfinder not found, skipping...")
-            return
+            return []
 
         if domain_list_file:
             cmd = ['subfinder', '-dL', domain_list_file, '--silent', '-recursive',
@@ -629,34 +1057,67 @@ class Frogy:
             cmd = ['subfinder', '-d', self.domain, '--silent',
                    '-o', str(self.output_dir / 'subfinder.txtls')]
 
-        exit_code, stdout, stderr = run_command(cmd, timeout=600)
+        # Results are taken from stdout; the -o copy is kept as raw output
+        exit_code, stdout, stderr = run_command_bytes(cmd, timeout=600)
+        return run_unfurl_domains(decode_lines(stdout), self.unfurl)
 
-        subfinder_file = self.output_dir / 'subfinder.txtls'
-        if subfinder_file.exists():
-            domains = read_file_lines(str(subfinder_file))
-            domains = run_unfurl_domains(domains)
-            domains = run_anew(domains, self.all_domains)
-            self.all_domains.extend(domains)
-
-    def extract_root_domains(self, domains: List[str]) -> List[str]:
-        """Extract root domains from a list of domains"""
-        root_domains = set()
-        # Regex pattern to match root domains: [^.]*.[^.]{2,3}(?:.[^.]{2,3})?$
-        regex = r"[^.]*.[^.]{2,3}(?:.[^.]{2,3})?$"
+    def run_all_enumerations(self):
+        """Run the independent enumeration stages concurrently and merge their results"""
+        print_step("Identifying Subdomains")
 
+        # Subfinder is not listed separately: it consumes the CHAOS output
+        # and is run by chaos_enumeration
+        stages = [
+            self.chaos_enumeration,
+            self.amass_enumeration,
+            self.wayback_enumeration,
+            self.certificate_enumeration,
+            self.findomain_enumeration,
+        ]
+
+        executor = ThreadPoolExecutor(max_workers=len(stages))
+        try:
+            futures = {executor.submit(stage): stage.__name__ for stage in stages}
+            # Results are merged on this thread only, so all_domains needs no lock.
+            # Merging in submission order keeps the .master order stable between runs
+            for future, name in futures.items():
+                try:
+                    domains = future.result()
+                except Exception as e:
+                    print_error(f"{name} failed: {e}")
+                    continue
+                self.add_domains(domains)
+        except KeyboardInterrupt:
+            # Don't wait for the stages: stop queued ones and kill running tools
+            executor.shutdown(wait=False, cancel_futures=True)
+            kill_running_processes()
+            raise
+        executor.shutdown()
+
+    def _filter_new(self, domains: List[str]) -> List[str]:
+        """Return the domains not seen before, marking them as seen"""
+        seen = self._seen_norm
+        new = []
         for domain in domains:
-            domain = domain.strip().lower()
-            if not domain or ' ' in domain or '@' in domain:
-                continue
+            normalized = domain.lower().strip()
+            if normalized and normalized not in seen:
+                seen.add(normalized)
+                new.append(domain)
+        return new
+
+    def add_domains(self, domains: List[str]) -> List[str]:
+        """Append domains not collected yet to all_domains and return them"""
+        added = self._filter_new(domains)
+        self.all_domains.extend(added)
+        return added
 
-            # Find root domain matches
-            matches = re.finditer(regex, domain, re.MULTILINE)
-            for match in matches:
-                root_domain = match.group().lower().strip()
-                if root_domain and '.' in root_domain:
-                    root_domains.add(root_domain)
-
-        return list(root_domains)
+    def extract_root_domains(self, domains: List[str]) -> List[str]:
+        """Extract root domains from a list of domains"""
+        candidates = (domain.strip().lower() for domain in domains)
+        matches = (_ROOT_DOMAIN_RE.search(domain) for domain in candidates
+                   if domain and ' ' not in domain and '@' not in domain)
+        # dict keeps first-seen order, so rootdomain.txtls and subfinder's input are stable
+        return list(dict.fromkeys(match.group() for match in matches if match))
 
     def gather_root_domains(self):
         """Extract root domains from collected domains"""
@@ -664,7 +1125,6 @@ class Frogy:
 
         # Extract root domains from all collected domains
         root_domains = self.extract_root_domains(self.all_domains)
-        root_domains = unique_lines(root_domains)
 
         rootdomain_file = Path('rootdomain.txtls')
         write_file_lines(str(rootdomain_file), root_domains)
@@ -672,17 +1132,16 @@ class Frogy:
         # Run subfinder2 on root domains
         if root_domains and check_tool('subfinder'):
             subfinder2_file = self.output_dir / 'subfinder2.txtls'
-            exit_code, stdout, stderr = run_command(
+            exit_code, stdout, stderr = run_command_bytes(
                 ['subfinder', '-dL', str(rootdomain_file), '--silent',
                  '-o', str(subfinder2_file)],
                 timeout=600
             )
 
-            if subfinder2_file.exists():
-                domains = read_file_lines(str(subfinder2_file))
-                domains = run_unfurl_domains(domains)
-                domains = run_anew(domains, self.all_domains)
-                self.all_domains.extend(domains)
+            domains = decode_lines(stdout)
+            if domains:
+                domains = run_unfurl_domains(domains, self.unfurl)
+                domains = self.add_domains(domains)
 
                 valid_domains = [d for d in domains if ' ' not in d and '@' not in d and '.' in d]
                 print_count("Subfinder", len(valid_domains))
@@ -696,11 +1155,12 @@ class Frogy:
         print_step("Resolving domains...")
 
         # Add www and root domain
-        master_domains = unique_lines(self.all_domains + [f'www.{self.domain}', self.domain])
-        master_domains = run_unfurl_domains(master_domains)
+        self.add_domains([f'www.{self.domain}', self.domain])
+        master_domains = run_unfurl_domains(self.all_domains, self.unfurl)
 
         master_file = self.output_dir / f'{self.cdir}.master'
         write_file_lines(str(master_file), master_domains)
+        self._master_domains = master_domains
 
         if not check_tool('dnsx'):
             print_warning("dnsx not found, skipping resolution...")
@@ -710,12 +1170,32 @@ class Frogy:
 
         resolved_file = self.output_dir / 'resolved.json'
         live_file = Path('live.assets')
-
-        exit_code, stdout, stderr = run_command(
+        live_domains = []
+
+        def collect_hosts(lines: Iterable[bytes]):
+            append = live_domains.append
+            for line in lines:
+                if line.strip():
+                    try:
+                        data = json_loads(line)
+                        if 'host' in data:
+                            host = data['host']
+                            if isinstance(host, str):
+                                append(host)
+                            elif isinstance(host, list):
+                                live_domains.extend(host)
+                    except json.JSONDecodeError:
+                        continue
+
+        # dnsx JSON is parsed straight from the pipe; resolved.json is only written
+        exit_code, error = stream_command(
             ['dnsx', '-l', str(master_file), '-silent', '-a', '-aaaa', '-cname',
              '-ns', '-txt', '-ptr', '-mx', '-soa', '-axfr', '-caa', '-resp',
-             '-json', '-o', str(resolved_file)],
+             '-json'],
+            collect_hosts,
             timeout=600,
+            tee_file=resolved_file,
+            text=False,
             show_spinner=True,
             spinner_message=f"Resolving {len(master_domains)} domains with dnsx",
             spinner_details=[
@@ -725,33 +1205,14 @@ class Frogy:
             ]
         )
 
-        if exit_code == -1 and "timed out" in stderr:
+        if exit_code == -1 and "timed out" in error:
             print_warning("dnsx timed out, continuing with available results...")
+        elif exit_code == -1 and error:
+            print_error(f"Error parsing dnsx output: {error}")
         elif exit_code != 0:
             print_warning(f"dnsx exited with code {exit_code}, continuing...")
 
-        if resolved_file.exists():
-            try:
-                with open(resolved_file, 'r') as f:
-                    live_domains = []
-                    for line in f:
-                        if line.strip():
-                            try:
-                                data = json.loads(line)
-                                if 'host' in data:
-                                    host = data['host']
-                                    if isinstance(host, str):
-                                        live_domains.append(host)
-                                    elif isinstance(host, list):
-                                        live_domains.extend(host)
-                            except json.JSONDecodeError:
-                                continue
-
-                    live_domains = unique_lines(live_domains)
-                    write_file_lines(str(live_file), live_domains)
-            except Exception as e:
-                print_error(f"Error parsing resolved.json: {e}")
-                live_file.touch()
+        write_file_lines(str(live_file), unique_lines(live_domains))
 
     def web_discovery(self):
         """Web discovery using httpx"""
@@ -774,11 +1235,28 @@ class Frogy:
         ports = '80,81,82,88,135,143,300,443,554,591,593,832,902,981,993,1010,1024,1311,2077,2079,2082,2083,2086,2087,2095,2096,2222,2480,3000,3128,3306,3333,3389,4243,4443,4567,4711,4712,4993,5000,5001,5060,5104,5108,5357,5432,5800,5985,6379,6543,7000,7170,7396,7474,7547,8000,8001,8008,8014,8042,8069,8080,8081,8083,8085,8088,8089,8090,8091,8118,8123,8172,8181,8222,8243,8280,8281,8333,8443,8500,8834,8880,8888,8983,9000,9043,9060,9080,9090,9091,9100,9200,9443,9800,9981,9999,10000,10443,12345,12443,16080,18091,18092,20720,28017,49152'
 
         csv_file = self.output_dir / 'web_intelligence.csv'
+        sites = []
 
-        exit_code, stdout, stderr = run_command(
+        def collect_sites(lines: Iterable[str]):
+            # Titles and server banners often contain commas, so split with csv
+            reader = csv.reader(lines)
+            header = next(reader, None)
+            if not header or 'url' not in header:
+                return
+            url_idx = header.index('url')
+            for row in reader:
+                if len(row) > url_idx:
+                    url = row[url_idx].strip()
+                    if url.startswith('http'):
+                        sites.append(url)
+
+        # httpx CSV is parsed straight from the pipe; web_intelligence.csv is only written
+        exit_code, error = stream_command(
             ['httpx', '-fr', '-nc', '-silent', '-l', str(live_file),
-             '-p', ports, '-csv', '-o', str(csv_file)],
+             '-p', ports, '-csv'],
+            collect_sites,
             timeout=1800,
+            tee_file=csv_file,
             show_spinner=True,
             spinner_message=f"Scanning {len(live_domains)} domains with httpx",
             spinner_details=[
@@ -788,130 +1266,83 @@ class Frogy:
             ]
         )
 
-        if exit_code == -1 and "timed out" in stderr:
+        if exit_code == -1 and "timed out" in error:
             print_warning("httpx timed out after 30 minutes, continuing with available results...")
+        elif exit_code == -1 and error:
+            print_error(f"Error parsing httpx output: {error}")
         elif exit_code != 0:
             print_warning(f"httpx exited with code {exit_code}, continuing with available results...")
 
-        if csv_file.exists():
-            sites = []
-            with open(csv_file, 'r') as f:
-                for line in f:
-                    if line.strip() and 'url' not in line.lower():
-                        parts = line.split(',')
-                        if len(parts) >= 9:
-                            url = parts[8].strip()
-                            if url and url.startswith('http'):
-                                sites.append(url)
-
-            sites = unique_lines(sites)
-            site_list_file = self.output_dir / 'site_list.txtls'
-            write_file_lines(str(site_list_file), sites)
-            print_count("Web applications", len(sites))
-        else:
-            print_warning("No web_intelligence.csv file generated")
-            # Create empty file
-            site_list_file = self.output_dir / 'site_list.txtls'
-            site_list_file.touch()
+        sites = unique_lines(sites)
+        site_list_file = self.output_dir / 'site_list.txtls'
+        write_file_lines(str(site_list_file), sites)
+        print_count("Web applications", len(sites))
 
         live_file.unlink(missing_ok=True)
 
-    def build_results_table(self):
-        """Build comprehensive results table from all sources"""
-        # Load domains from master file
-        master_file = self.output_dir / f'{self.cdir}.master'
-        if not master_file.exists():
-            return []
-
-        all_domains = read_file_lines(str(master_file))
+    def master_domains(self) -> List[str]:
+        """Return the master domain list, reading the file only if this run didn't write it"""
+        if self._master_domains is None:
+            master_file = self.output_dir / f'{self.cdir}.master'
+            self._master_domains = read_file_lines(str(master_file))
+        return self._master_domains
+
+    def iter_results(self) -> Iterator[dict]:
+        """Yield a results table row per domain, combining all sources"""
+        all_domains = self.master_domains()
+        if not all_domains:
+            return
 
         # Load DNS resolution data
         resolved_file = self.output_dir / 'resolved.json'
         dns_data = {}
-        if resolved_file.exists():
-            try:
-                with open(resolved_file, 'r') as f:
-                    for line in f:
-                        if line.strip():
-                            try:
-                                data = json.loads(line)
-                                host = data.get('host', '')
-                                if host:
-                                    dns_data[host] = {
-                                        'a': data.get('a', []),
-                                        'aaaa': data.get('aaaa', []),
-                                        'cname': data.get('cname', []),
-                                        'mx': data.get('mx', []),
-                                        'txt': data.get('txt', []),
-                                    }
-                            except json.JSONDecodeError:
-                                continue
-            except Exception:
-                pass
+        for data in iter_json_lines(str(resolved_file)):
+            host = data.get('host')
+            if not isinstance(host, str):
+                continue
+            # Keys use the same normalization as the lookups below
+            host = host.lower().rstrip('.')
+            if host:
+                dns_data[host] = {
+                    'a': data.get('a', []),
+                    'aaaa': data.get('aaaa', []),
+                    'cname': data.get('cname', []),
+                    'mx': data.get('mx', []),
+                    'txt': data.get('txt', []),
+                }
 
         # Load web intelligence data
         web_file = self.output_dir / 'web_intelligence.csv'
         web_data = {}
         if web_file.exists():
-            try:
-                with open(web_file, 'r', encoding='utf-8') as f:
-                    reader = csv.DictReader(f)
-                    for row in reader:
-                        url = row.get('url', '').strip()
-                        host = row.get('host', '').strip()
-                        status = row.get('status_code', '').strip()
-                        title = row.get('title', '').strip()
-
-                        # Extract host from URL if needed
-                        if not host and url:
-                            try:
-                                parsed = urllib.parse.urlparse(url)
-                                host = parsed.hostname or ''
-                            except:
-                                pass
-
-                        if host:
-                            if host not in web_data:
-                                web_data[host] = []
-                            web_data[host].append({
-                                'url': url,
-                                'status': status,
-                                'title': title
-                            })
-            except Exception as e:
-                # Fallback to simple parsing if CSV module fails
-                try:
-                    with open(web_file, 'r', encoding='utf-8') as f:
-                        lines = f.readlines()
-                        if len(lines) > 1:  # Skip header
-                            for line in lines[1:]:
-                                parts = line.split(',')
-                                if len(parts) >= 9:
-                                    url = parts[8].strip()
-                                    host = parts[15].strip() if len(parts) > 15 else ''
-                                    status = parts[29].strip() if len(parts) > 29 else ''
-
-                                    # Extract host from URL if needed
-                                    if not host and url:
-                                        try:
-                                            parsed = urllib.parse.urlparse(url)
-                                            host = parsed.hostname or ''
-                                        except:
-                                            pass
-
-                                    if host:
-                                        if host not in web_data:
-                                            web_data[host] = []
-                                        web_data[host].append({
-                                            'url': url,
-                                            'status': status,
-                                            'title': title
-                                        })
-                except:
-                    pass
+            with open(web_file, 'r', encoding='utf-8', errors='replace', newline='') as f:
+                # Positional rows with header indices, no per-row dict as in DictReader
+                reader = csv.reader(f)
+                header = next(reader, [])
+                columns = {name: i for i, name in enumerate(header)}
+                # -1 marks a missing column; it never satisfies the width checks below
+                url_idx = columns.get('url', -1)
+                host_idx = columns.get('host', -1)
+                for row in reader:
+                    width = len(row)
+                    url = row[url_idx].strip() if 0 <= url_idx < width else ''
+                    host = row[host_idx].strip() if 0 <= host_idx < width else ''
+
+                    # Extract host from URL if needed
+                    if not host and url:
+                        match = _URL_HOST_RE.match(url)
+                        if match:
+                            host = match.group(1) or match.group(2)
+
+                    host = host.lower().rstrip('.')
+                    if host:
+                        # Only the first two URLs per host are shown
+                        urls = web_data.setdefault(host, [])
+                        if len(urls) < 2:
+                            urls.append(url)
 
         # Determine sources for each domain
-        sources_map = {}
+        sources_map = defaultdict(int)
         source_files = {
             'amass': self.raw_output_dir / 'amass.txtls',
             'findomain': self.raw_output_dir / 'findomain.txtls',
@@ -925,79 +1356,83 @@ class Frogy:
         if chaos_file.exists():
             source_files['chaos'] = chaos_file
 
-        for source_name, source_file in source_files.items():
-            if source_file.exists():
-                source_domains = read_file_lines(str(source_file))
-                for domain in source_domains:
-                    # Normalize domain: lowercase, strip, remove trailing dot
-                    domain_normalized = domain.lower().strip().rstrip('.')
-                    if domain_normalized:
-                        if domain_normalized not in sources_map:
-                            sources_map[domain_normalized] = []
-                        if source_name not in sources_map[domain_normalized]:
-                            sources_map[domain_normalized].append(source_name)
-
-        # Build results table
-        results = []
+        # Source files are independent, so read and normalize them concurrently
+        with ThreadPoolExecutor(max_workers=len(source_files)) as executor:
+            futures = {
+                source_name: executor.submit(_load_and_normalize, str(source_file))
+                for source_name, source_file in source_files.items()
+                if source_file.exists()
+            }
+            # One bit per source, in the order listed above
+            source_names = list(futures)
+            for bit, future in enumerate(futures.values()):
+                flag = 1 << bit
+                for domain_normalized in future.result():
+                    sources_map[domain_normalized] |= flag
+
+        # Few distinct source combinations exist, so each label is built once
+        source_labels = {0: 'unknown'}
+
+        # Rows are produced lazily; only the first ones are rendered
         for domain in all_domains:
-            # Normalize domain for lookups
-            domain_normalized = domain.lower().strip().rstrip('.')
+            # Normalize domain once for all lookups
+            domain_normalized = domain.lower().rstrip('.')
 
             # Get IP addresses
             ips = []
-            if domain_normalized in dns_data:
-                ips.extend(dns_data[domain_normalized].get('a', []))
-                ips.extend(dns_data[domain_normalized].get('aaaa', []))
-            # Also try with trailing dot removed
-            elif domain_normalized.rstrip('.') in dns_data:
-                domain_key = domain_normalized.rstrip('.')
-                ips.extend(dns_data[domain_key].get('a', []))
-                ips.extend(dns_data[domain_key].get('aaaa', []))
-            ips = list(set(ips))[:3]  # Limit to 3 IPs
+            dns_entry = dns_data.get(domain_normalized)
+            if dns_entry:
+                # First 3 unique addresses, A before AAAA; stop once the limit is hit
+                seen = set()
+                for ip in chain(dns_entry.get('a', []), dns_entry.get('aaaa', [])):
+                    if ip not in seen:
+                        seen.add(ip)
+                        ips.append(ip)
+                        if len(ips) == 3:
+                            break
 
             # Get web URLs
-            web_urls = []
-            if domain_normalized in web_data:
-                web_urls = [w['url'] for w in web_data[domain_normalized][:2]]  # Limit to 2 URLs
-            elif domain_normalized.rstrip('.') in web_data:
-                domain_key = domain_normalized.rstrip('.')
-                web_urls = [w['url'] for w in web_data[domain_key][:2]]
+            web_urls = web_data.get(domain_normalized, [])
 
             # Get sources
-            sources = sources_map.get(domain_normalized, [])
-            if not sources:
-                sources = sources_map.get(domain_normalized.rstrip('.'), [])
-            source_str = ', '.join(sources) if sources else 'unknown'
+            mask = sources_map.get(domain_normalized, 0)
+            source_str = source_labels.get(mask)
+            if source_str is None:
+                source_str = source_labels[mask] = ', '.join(
+                    name for bit, name in enumerate(source_names) if mask >> bit & 1)
 
             # Determine status
             status = '🟢 Live' if ips else '⚪ No IP'
             if web_urls:
                 status = '🌐 Web'
 
-            results.append({
+            yield {
                 'domain': domain,
                 'ips': ips,
                 'web_urls': web_urls,
                 'sources': source_str,
                 'status': status
-            })
+            }
 
-        return results
-
-    def print_results_table(self, results: List[dict]):
+    def print_results_table(self, results: Iterable[dict]):
         """Print beautiful results table"""
-        if not results:
+        results = iter(results)
+        first = next(results, None)
+        if first is None:
             return
 
+        emit('')
         print_header("DISCOVERED ASSETS")
-        print()
+
+        # Rows are buffered and written in one go rather than a print per line
+        lines = ['']
 
         # Helper function to get display width without ANSI codes
         def display_width(text):
-            return len(re.sub(r'\033\[[0-9;]*m', '', str(text)))
+            return len(_ANSI_RE.sub('', str(text)))
 
         # Table header
-        print(colorize("┌" + "─" * 42 + "┬" + "─" * 28 + "┬" + "─" * 14 + "┬" + "─" * 22 + "┐", Colors.DIM))
+        lines.append(colorize("┌" + "─" * 42 + "┬" + "─" * 28 + "┬" + "─" * 14 + "┬" + "─" * 22 + "┐", Colors.DIM))
 
         domain_hdr = colorize('Domain', Colors.BOLD + Colors.BRIGHT_CYAN)
         ip_hdr = colorize('IP Address(es)', Colors.BOLD + Colors.BRIGHT_CYAN)
@@ -1005,12 +1440,21 @@ class Frogy:
         source_hdr = colorize('Sources', Colors.BOLD + Colors.BRIGHT_CYAN)
 
         header = f"│ {domain_hdr:<40} │ {ip_hdr:<26} │ {status_hdr:<12} │ {source_hdr:<20} │"
-        print(header)
-        print(colorize("├" + "─" * 42 + "┼" + "─" * 28 + "┼" + "─" * 14 + "┼" + "─" * 22 + "┤", Colors.DIM))
+        lines.append(header)
+        lines.append(colorize("├" + "─" * 42 + "┼" + "─" * 28 + "┼" + "─" * 14 + "┼" + "─" * 22 + "┤", Colors.DIM))
+
+        # Rows (limit to 50 for readability); the rest are only counted
+        max_rows = 50
+        total_count = live_count = web_count = 0
+        for result in chain((first,), results):
+            total_count += 1
+            if result['ips']:
+                live_count += 1
+            if result['web_urls']:
+                web_count += 1
+            if total_count > max_rows:
+                continue
 
-        # Print rows (limit to 50 for readability)
-        display_count = min(50, len(results))
-        for result in results[:display_count]:
             domain = result['domain'][:38]
 
             # Format IPs
@@ -1035,9 +1479,9 @@ class Frogy:
             sources = result['sources'][:20] if result['sources'] != 'unknown' else 'N/A'
 
             # Colorize columns
-            domain_colored = colorize(domain.ljust(40), Colors.WHITE)
-            ip_colored = colorize(ips_str.ljust(26), Colors.CYAN if result['ips'] else Colors.DIM)
-            source_colored = colorize(sources.ljust(20), Colors.YELLOW)
+            domain_colored = colorize_padded(domain, 40, Colors.WHITE)
+            ip_colored = colorize_padded(ips_str, 26, Colors.CYAN if result['ips'] else Colors.DIM)
+            source_colored = colorize_padded(sources, 20, Colors.YELLOW)
 
             # Calculate padding for status (accounting for ANSI codes)
             status_len = display_width(status_colored)
@@ -1045,25 +1489,24 @@ class Frogy:
             status_final = status_colored + status_padding
 
             row = f"│ {domain_colored} │ {ip_colored} │ {status_final} │ {source_colored} │"
-            print(row)
+            lines.append(row)
 
-        print(colorize("└" + "─" * 42 + "┴" + "─" * 28 + "┴" + "─" * 14 + "┴" + "─" * 22 + "┘", Colors.DIM))
+        lines.append(colorize("└" + "─" * 42 + "┴" + "─" * 28 + "┴" + "─" * 14 + "┴" + "─" * 22 + "┘", Colors.DIM))
 
-        if len(results) > display_count:
-            print()
-            print(colorize(f"  ... and {len(results) - display_count} more domains", Colors.DIM))
-            print(colorize(f"  See {self.cdir}.master for complete list", Colors.DIM))
+        if total_count > max_rows:
+            lines.append('')
+            lines.append(colorize(f"  ... and {total_count - max_rows} more domains", Colors.DIM))
+            lines.append(colorize(f"  See {self.cdir}.master for complete list", Colors.DIM))
 
         # Statistics
-        live_count = sum(1 for r in results if r['ips'])
-        web_count = sum(1 for r in results if r['web_urls'])
+        lines.append('')
+        lines.append(colorize(f"  📊 Statistics:", Colors.BOLD + Colors.BRIGHT_YELLOW))
+        lines.append(colorize(f"    Total domains discovered: {total_count}", Colors.CYAN))
+        lines.append(colorize(f"    Resolved (with IP): {live_count}", Colors.BRIGHT_GREEN))
+        lines.append(colorize(f"    Web applications found: {web_count}", Colors.BRIGHT_GREEN))
+        lines.append('')
 
-        print()
-        print(colorize(f"  📊 Statistics:", Colors.BOLD + Colors.BRIGHT_YELLOW))
-        print(colorize(f"    Total domains discovered: {len(results)}", Colors.CYAN))
-        print(colorize(f"    Resolved (with IP): {live_count}", Colors.BRIGHT_GREEN))
-        print(colorize(f"    Web applications found: {web_count}", Colors.BRIGHT_GREEN))
-        print()
+        emit('\n'.join(lines))
 
     def generate_summary(self):
         """Generate final summary"""
@@ -1074,10 +1517,10 @@ class Frogy:
         live_file = Path('live.assets')
         site_list_file = self.output_dir / 'site_list.txtls'
 
-        root_count = len(read_file_lines(str(rootdomain_file))) if rootdomain_file.exists() else 0
-        subdomain_count = len(read_file_lines(str(master_file))) if master_file.exists() else 0
-        resolved_count = len(read_file_lines(str(live_file))) if live_file.exists() else 0
-        web_count = len(read_file_lines(str(site_list_file))) if site_list_file.exists() else 0
+        root_count = count_file_lines(str(rootdomain_file))
+        subdomain_count = len(self.master_domains())
+        resolved_count = count_file_lines(str(live_file))
+        web_count = count_file_lines(str(site_list_file))
 
         print(colorize(f"  Total unique root domains found: {root_count}", Colors.BRIGHT_CYAN))
         print(colorize(f"  Total unique subdomains found: {subdomain_count}", Colors.BRIGHT_CYAN))
@@ -1090,24 +1533,28 @@ class Frogy:
             print(colorize(f"Root domain: {', '.join(root_domains[:5])}", Colors.BRIGHT_GREEN))
 
         # Generate and print results table
-        results = self.build_results_table()
-        if results:
-            print()
-            self.print_results_table(results)
+        self.print_results_table(self.iter_results())
 
         if master_file.exists():
             print(colorize("\nFull DNS master list:", Colors.BOLD + Colors.BRIGHT_YELLOW))
-            domains = read_file_lines(str(master_file))
-            print(colorize(f"  See {master_file.name} for complete list ({len(domains)} domains)", Colors.DIM))
+            print(colorize(f"  See {master_file.name} for complete list ({subdomain_count} domains)", Colors.DIM))
 
     def cleanup(self):
         """Move files to raw_output"""
         print_info("Cleaning up...")
 
         # Move all .txtls files to raw_output except rootdomain.txtls
-        for txtls_file in self.output_dir.glob('*.txtls'):
-            if txtls_file.name != 'rootdomain.txtls':
-                shutil.move(str(txtls_file), str(self.raw_output_dir / txtls_file.name))
+        with os.scandir(self.output_dir) as entries:
+            txtls_files = [entry for entry in entries
+                           if entry.name.endswith('.txtls') and entry.name != 'rootdomain.txtls'
+                           and entry.is_file()]
+        for entry in txtls_files:
+            target = self.raw_output_dir / entry.name
+            try:
+                # raw_output lives inside output_dir, so a plain rename normally suffices
+                os.replace(entry.path, target)
+            except OSError:
+                shutil.move(entry.path, str(target))
 
     def run(self):
         """Run all enumeration steps"""
@@ -1121,11 +1568,7 @@ class Frogy:
         print()
 
         try:
-            self.chaos_enumeration()
-            self.amass_enumeration()
-            self.wayback_enumeration()
-            self.certificate_enumeration()
-            self.findomain_enumeration()
+            self.run_all_enumerations()
             self.gather_root_domains()
             self.resolve_domains()
             self.web_discovery()
@@ -1162,46 +1605,31 @@ def clean_temp_files():
         '*.txt',  # CHAOS txt files
     ]
 
+    # Skip important files
+    keep_files = {'requirements.txt', 'README.txt'}
+
     cleaned_count = 0
 
     print_header("Cleaning Temporary Files")
 
-    # Remove specific temp files
-    for temp_file in temp_files:
-        file_path = Path(temp_file)
-        if file_path.exists():
-            try:
-                file_path.unlink()
-                print_success(f"Removed: {temp_file}")
-                cleaned_count += 1
-            except Exception as e:
-                print_error(f"Failed to remove {temp_file}: {e}")
-
-    # Remove files matching patterns (but be careful not to delete important files)
-    for pattern in temp_patterns:
-        for file_path in Path('.').glob(pattern):
-            # Skip important files
-            if file_path.name in ['requirements.txt', 'README.txt']:
-                continue
-            # Skip files in subdirectories (like wordlist/)
-            if file_path.parent != Path('.'):
-                continue
-            try:
-                file_path.unlink()
-                print_success(f"Removed: {file_path.name}")
-                cleaned_count += 1
-            except Exception as e:
-                print_error(f"Failed to remove {file_path.name}: {e}")
-
-    # Clean index.json variants
-    for json_file in Path('.').glob('index.json*'):
-        if json_file.parent == Path('.'):
-            try:
-                json_file.unlink()
-                print_success(f"Removed: {json_file.name}")
-                cleaned_count += 1
-            except Exception as e:
-                print_error(f"Failed to remove {json_file.name}: {e}")
+    # One pass over the current directory; subdirectories (like wordlist/) are not descended into
+    with os.scandir('.') as entries:
+        targets = [
+            entry for entry in entries
+            if (entry.name in temp_files
+                or entry.name.startswith('index.json')  # index.json variants
+                or (entry.name not in keep_files
+                    and any(fnmatch.fnmatch(entry.name, pattern) for pattern in temp_patterns)))
+            and entry.is_file()
+        ]
+
+    for entry in sorted(targets, key=lambda entry: entry.name):
+        try:
+            os.unlink(entry.path)
+            print_success(f"Removed: {entry.name}")
+            cleaned_count += 1
+        except Exception as e:
+            print_error(f"Failed to remove {entry.name}: {e}")
 
     if cleaned_count == 0:
         print_info("No temporary files found to clean")
@@ -1226,6 +1654,10 @@ Examples:
     parser.add_argument('org', nargs='?', help='Organisation name (optional)')
     parser.add_argument('--chaos', action='store_true',
                        help='Use CHAOS dataset (default: False)')
+    parser.add_argument('--unfurl', action='store_true',
+                       help='Extract hostnames with the unfurl tool (default: False)')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Re-download crt.sh and CHAOS data instead of using the local cache')
     parser.add_argument('--clean', action='store_true',
                        help='Clean all temporary files and exit')
 
@@ -1240,7 +1672,7 @@ Examples:
     if not args.domain:
         parser.error("domain is required unless using --clean")
 
-    frogy = Frogy(args.domain, args.org, args.chaos)
+    frogy = Frogy(args.domain, args.org, args.chaos, args.unfurl, not args.no_cache)
     frogy.run()
 
 
@@ -34,6 +34,7 @@ echo "Cleanup cache..."
 brew cleanup 2>/dev/null
 echo "Installing Python requirements..."
 python3 -m pip install --upgrade pip 2>/dev/null
+python3 -m pip install orjson 2>/dev/null
 
 chmod +x frogy.py
 echo "Enter user password to install supply libs..."